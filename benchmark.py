@@ -0,0 +1,140 @@
+# benchmark.py
+
+import gc
+import os
+import sys
+import time
+import argparse
+
+# Run without opening a window unless a video driver was chosen explicitly
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+from scenes.main_scene import MainScene
+from core.memory import memory_tracker
+from core.renderer import RENDERERS
+from settings import RENDER_BACKEND
+
+# Scripted movement so every run walks the same path through the dungeon
+MOVEMENT_PATTERN = [(1, 0)] * 120 + [(0, 1)] * 60 + [(-1, 0)] * 120 + [(0, -1)] * 60
+
+# Scheduler load scenario: simulated monsters spread over every level of detail band,
+# plus an AI/path style job queued every frame
+MONSTER_DISTANCES = [50, 150, 300, 500, 700, 1000, 1400, 2500]  # World pixels right of the player
+MONSTER_COST_MS = 0.6
+PATH_JOB_COST_MS = 1.0
+
+
+def busy_wait(ms):
+    """Spend roughly `ms` milliseconds of CPU time, standing in for real AI work."""
+    end = time.perf_counter() + ms / 1000
+    while time.perf_counter() < end:
+        pass
+
+
+class SimulatedMonster:
+    """Stand-in for a monster whose AI update takes a fixed amount of time."""
+
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+        self.update_interval = 1
+        self.update_cost_ms = MONSTER_COST_MS
+
+    def update(self):
+        busy_wait(MONSTER_COST_MS)
+
+
+def add_scheduler_load(scene):
+    """Register non-essential monsters at several camera distances."""
+    for index, distance in enumerate(MONSTER_DISTANCES):
+        monster = SimulatedMonster(scene.player.x + distance, scene.player.y)
+        scene.scheduler.add_entity(f"monster_{index}_{distance}px", monster)
+
+
+def run_frames(scene, frames, path_jobs=False):
+    """
+    Update, render and present the scene for a number of frames, returning each frame's time in ms.
+
+    :param path_jobs: Queue one path request job per frame
+    """
+    frame_times = []
+    for frame in range(frames):
+        start = time.perf_counter()
+
+        if path_jobs:
+            scene.scheduler.queue_job("path_request", lambda: busy_wait(PATH_JOB_COST_MS), PATH_JOB_COST_MS)
+
+        scene.renderer.begin_frame()
+        pygame.event.pump()
+        dx, dy = MOVEMENT_PATTERN[frame % len(MOVEMENT_PATTERN)]
+        scene.player.set_movement(dx, dy)
+        scene.update()
+        scene.render()
+        scene.renderer.present()
+
+        frame_times.append((time.perf_counter() - start) * 1000)
+    return frame_times
+
+
+def print_frame_stats(name, frame_times):
+    """Print average, 95th percentile and worst frame times."""
+    ordered = sorted(frame_times)
+    average = sum(ordered) / len(ordered)
+    p95 = ordered[int(len(ordered) * 0.95) - 1]
+    print(f"{name}: avg {average:.3f} ms, p95 {p95:.3f} ms, max {ordered[-1]:.3f} ms "
+          f"({len(ordered)} frames)")
+
+
+def print_scheduler_report(scene):
+    """Print how much of the update budget was used and which tasks were deferred."""
+    print("Update scheduler:")
+    for line in scene.scheduler.report():
+        print(f"  {line}")
+    for name, count in sorted(scene.scheduler.deferred_counts.items()):
+        print(f"    deferred {name}: {count} times")
+
+
+def print_memory_report():
+    """Print the tracked surface memory by category and by owner."""
+    print("Surface memory:")
+    for line in memory_tracker.report():
+        print(f"  {line}")
+    for category in sorted(memory_tracker.bytes_by_category()):
+        for owner, size in sorted(memory_tracker.bytes_by_owner(category).items()):
+            print(f"    {category} / {owner}: {size} bytes")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the main scene without a window.")
+    parser.add_argument("--frames", type=int, default=600, help="Number of frames to render")
+    parser.add_argument("--renderer", choices=list(RENDERERS), action="append",
+                        help="Render backend to compare (repeatable, default: all)")
+    args = parser.parse_args()
+
+    pygame.init()
+
+    # Run each backend on the same scripted path so their frame times compare directly
+    for name in args.renderer or list(RENDERERS):
+        scene = MainScene(renderer=name)
+        print_frame_stats(f"main scene ({name})", run_frames(scene, args.frames))
+        print_scheduler_report(scene)
+        print_memory_report()
+
+        # Free this backend's surfaces so they don't show up in the next report
+        scene = None
+        gc.collect()
+
+    # Load the scheduler so its budget, deferral and level of detail show up
+    scene = MainScene(renderer=RENDER_BACKEND)
+    add_scheduler_load(scene)
+    print_frame_stats(f"main scene ({RENDER_BACKEND}, scheduler load)",
+                      run_frames(scene, args.frames, path_jobs=True))
+    print_scheduler_report(scene)
+
+    pygame.quit()
+    sys.exit()
+
+
+if __name__ == "__main__":
+    main()
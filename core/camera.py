@@ -4,16 +4,21 @@ import pygame
 from settings import SCREEN_WIDTH, SCREEN_HEIGHT, ZOOM
 
 class Camera:
-    def __init__(self):
-        self.zoom = ZOOM
+    def __init__(self, zoom=ZOOM, view_size=(SCREEN_WIDTH, SCREEN_HEIGHT)):
+        """
+        :param zoom: Scale applied to world positions
+        :param view_size: Size in pixels of the surface the world is drawn to
+        """
+        self.zoom = zoom
+        self.view_width, self.view_height = view_size
         self.offset_x = 0
         self.offset_y = 0
         self.smooth_factor = 0.1  # Smooth movement factor
 
     def update(self, player):
         """Update the camera's position smoothly to keep the player centered."""
-        target_x = player.x * self.zoom - SCREEN_WIDTH // 2
-        target_y = player.y * self.zoom - SCREEN_HEIGHT // 2
+        target_x = player.x * self.zoom - self.view_width // 2
+        target_y = player.y * self.zoom - self.view_height // 2
 
         # Lerp towards the target position for smooth movement
         self.offset_x += (target_x - self.offset_x) * self.smooth_factor
@@ -23,6 +28,11 @@ class Camera:
         self.offset_x = round(self.offset_x)
         self.offset_y = round(self.offset_y)
 
+    def world_center(self):
+        """Return the world position at the center of the screen."""
+        return ((self.offset_x + self.view_width // 2) / self.zoom,
+                (self.offset_y + self.view_height // 2) / self.zoom)
+
     def apply(self, position):
         """Apply camera offset and zoom to a given position."""
         x, y = position
@@ -1,7 +1,7 @@
 # core/dungeon.py
 
 import pygame
-from settings import TILE_SIZE, DUNGEON_MAP
+from settings import TILE_SIZE, HALF_TILE_SIZE, DUNGEON_MAP
 
 def render_static_dungeon(wall_image_1, wall_image_2, ground_image):
     """Render the entire dungeon onto a single surface with walls and ground textures."""
@@ -9,14 +9,28 @@ def render_static_dungeon(wall_image_1, wall_image_2, ground_image):
     dungeon_height = len(DUNGEON_MAP) * TILE_SIZE
     dungeon_surface = pygame.Surface((dungeon_width, dungeon_height))
 
-    # Draw each tile on the dungeon surface
+    # Draw each tile on the dungeon surface, clipped to one grid cell (some tile art is a pixel taller)
+    tile_area = pygame.Rect(0, 0, TILE_SIZE, TILE_SIZE)
     for y, row in enumerate(DUNGEON_MAP):
         for x, tile in enumerate(row):
             if tile == 1:  # Draw wall
                 # Alternate between wall images based on the x, y position (checkerboard pattern)
                 wall_image = wall_image_1 if (x + y) % 2 == 0 else wall_image_2
-                dungeon_surface.blit(wall_image, (x * TILE_SIZE, y * TILE_SIZE))
+                dungeon_surface.blit(wall_image, (x * TILE_SIZE, y * TILE_SIZE), tile_area)
             else:  # Draw ground
-                dungeon_surface.blit(ground_image, (x * TILE_SIZE, y * TILE_SIZE))
+                dungeon_surface.blit(ground_image, (x * TILE_SIZE, y * TILE_SIZE), tile_area)
 
     return dungeon_surface
+
+
+def can_move_to(new_x, new_y, size=HALF_TILE_SIZE):
+    """Check if a square of the given size can stand at the specified pixel coordinates."""
+    left_tile = int(new_x / TILE_SIZE)
+    right_tile = int((new_x + size - 1) / TILE_SIZE)
+    top_tile = int(new_y / TILE_SIZE)
+    bottom_tile = int((new_y + size - 1) / TILE_SIZE)
+
+    return (DUNGEON_MAP[top_tile][left_tile] == 0 and
+            DUNGEON_MAP[top_tile][right_tile] == 0 and
+            DUNGEON_MAP[bottom_tile][left_tile] == 0 and
+            DUNGEON_MAP[bottom_tile][right_tile] == 0)
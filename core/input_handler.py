@@ -2,10 +2,12 @@
 
 from settings import TILE_SIZE
 import pygame
+from net import protocol
 
 def handle_input(scene):
     keys = pygame.key.get_pressed()
     dx, dy = 0, 0
+    buttons = 0  # Buttons sent to the server when playing co-op
 
     # Toggle inventory with Q key (only toggle if Q was previously released)
     if keys[pygame.K_q]:
@@ -15,19 +17,30 @@ def handle_input(scene):
     else:
         scene.q_pressed = False  # Reset when Q is released
 
+    # Toggle the debug overlay (memory and update budget) with F3
+    if keys[pygame.K_F3]:
+        if not scene.f3_pressed:
+            scene.show_debug = not scene.show_debug
+            scene.f3_pressed = True
+    else:
+        scene.f3_pressed = False
+
     # Check for interaction with E key
     if keys[pygame.K_e] and not scene.inventory_open:
-        if not scene.dagger_picked_up and player_near_dagger(scene):
+        if scene.client:
+            buttons |= protocol.BUTTON_INTERACT  # The server decides who gets the item
+        elif not scene.dagger_picked_up and player_near_dagger(scene):
             if scene.inventory.add_item("dagger", scene.dagger_image, to_hotbar=True):
                 scene.dagger_picked_up = True
 
     # Check for punch with spacebar (if player has no weapon)
     if keys[pygame.K_SPACE] and not scene.inventory_open:
+        buttons |= protocol.BUTTON_PUNCH
         if not scene.player.is_punching:
             scene.player.start_punch()
             
-    # Take damage with H key (for testing)
-    if keys[pygame.K_h]:  
+    # Take damage with H key (for testing, single player only)
+    if keys[pygame.K_h] and not scene.client:
         scene.player.take_damage(5)  # Decrease health by 5 each press
         
     # Hotbar selection (1-0 keys)
@@ -54,6 +67,10 @@ def handle_input(scene):
             dx = -1
         if keys[pygame.K_d]:
             dx = 1
+
+    if scene.client:
+        scene.client.send_input(dx, dy, buttons)
+    elif not scene.inventory_open:
         scene.player.set_movement(dx, dy)
 
 def player_near_dagger(scene):
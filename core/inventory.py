@@ -1,4 +1,5 @@
 import pygame
+from core.memory import memory_tracker
 
 # Slot class to represent each slot in the inventory
 class Slot:
@@ -67,6 +68,7 @@ class Inventory:
         # Load the hotbar border image
         try:
             self.hotbar_border_image = pygame.image.load("assets/inventory/hotbar-box.png").convert_alpha()
+            memory_tracker.track(self.hotbar_border_image, "Inventory", "images")
             print("Hotbar border image loaded successfully")
         except pygame.error as e:
             print(f"Failed to load hotbar border image: {e}")
@@ -0,0 +1,188 @@
+# core/memory.py
+
+import weakref
+from collections import OrderedDict
+from settings import MEMORY_BUDGETS, MEMORY_BUDGET_WARNINGS
+
+
+def surface_bytes(surface):
+    """Return the number of bytes used by a surface's pixel data."""
+    return surface.get_pitch() * surface.get_height()
+
+
+class MemoryTracker:
+    """Keeps a tally of long-lived surfaces, tagged by owner and category."""
+
+    def __init__(self, budgets=None, warnings=MEMORY_BUDGET_WARNINGS):
+        """
+        :param budgets: Dict of category -> maximum bytes (defaults to MEMORY_BUDGETS)
+        :param warnings: If True, print a warning when a budget can't be met by evicting
+        """
+        self.budgets = dict(MEMORY_BUDGETS if budgets is None else budgets)
+        self.warnings = warnings
+        self.entries = {}  # id(surface) -> (weakref, owner, category, bytes)
+        self.evictors = {}  # category -> list of callbacks that free cached surfaces
+        self.warned = {}  # category -> bytes in use when we last warned about it
+
+    def track(self, surface, owner, category, enforce=True):
+        """
+        Start tracking a surface and return it, so calls can be chained.
+
+        :param enforce: Check the category's budget now (pass False when tracking
+                        a batch of surfaces, then call enforce_budget once)
+        """
+        key = id(surface)
+        if key in self.entries:
+            return surface
+
+        # Drop the entry automatically once the surface is garbage collected
+        ref = weakref.ref(surface, lambda _ref, key=key: self.entries.pop(key, None))
+        self.entries[key] = (ref, owner, category, surface_bytes(surface))
+        if enforce:
+            self.enforce_budget(category)
+        return surface
+
+    def untrack(self, surface):
+        """Stop tracking a surface (e.g. when it is replaced)."""
+        self.entries.pop(id(surface), None)
+
+    def register_evictor(self, category, callback):
+        """
+        Register a callback used to free memory when a category is over budget.
+
+        :param category: The category the callback frees memory from
+        :param callback: Called with no arguments; returns True if it evicted something
+        """
+        self.evictors.setdefault(category, []).append(callback)
+
+    def bytes_by_category(self):
+        """Return a dict of category -> bytes currently tracked."""
+        totals = {}
+        for _ref, _owner, category, size in self.entries.values():
+            totals[category] = totals.get(category, 0) + size
+        return totals
+
+    def bytes_by_owner(self, category=None):
+        """Return a dict of owner -> bytes, optionally limited to one category."""
+        totals = {}
+        for _ref, owner, entry_category, size in self.entries.values():
+            if category is None or entry_category == category:
+                totals[owner] = totals.get(owner, 0) + size
+        return totals
+
+    def total_bytes(self):
+        """Return the total number of bytes tracked across all categories."""
+        return sum(size for _ref, _owner, _category, size in self.entries.values())
+
+    def category_bytes(self, category):
+        """Return the number of bytes tracked in a single category."""
+        return sum(size for _ref, _owner, entry_category, size in self.entries.values()
+                   if entry_category == category)
+
+    def over_budget(self, category):
+        """Check if a category is using more memory than its budget allows."""
+        budget = self.budgets.get(category)
+        return budget is not None and self.category_bytes(category) > budget
+
+    def enforce_budget(self, category):
+        """Evict cached surfaces until the category fits its budget, warning if it can't."""
+        for evict in self.evictors.get(category, []):
+            while self.over_budget(category):
+                if not evict():
+                    break  # This cache has nothing left to give up
+
+        if self.over_budget(category):
+            # Warn again whenever usage keeps growing past what we last reported
+            used = self.category_bytes(category)
+            if self.warnings and used > self.warned.get(category, 0):
+                print(f"Warning: '{category}' surfaces use {format_bytes(used)}, "
+                      f"over the {format_bytes(self.budgets[category])} budget")
+                self.warned[category] = used
+        else:
+            self.warned.pop(category, None)
+
+    def report(self):
+        """Return a list of text lines describing memory use by category."""
+        lines = []
+        for category, size in sorted(self.bytes_by_category().items()):
+            budget = self.budgets.get(category)
+            budget_text = f" / {format_bytes(budget)}" if budget is not None else ""
+            lines.append(f"{category}: {format_bytes(size)}{budget_text}")
+        lines.append(f"total: {format_bytes(self.total_bytes())}")
+        return lines
+
+
+class SurfaceCache:
+    """Least-recently-used cache of surfaces that evicts when its category is over budget."""
+
+    def __init__(self, category, tracker=None):
+        """
+        :param category: Memory category the cached surfaces are counted under
+        :param tracker: The MemoryTracker to report to (defaults to the shared tracker)
+        """
+        self.category = category
+        self.tracker = tracker if tracker is not None else memory_tracker
+        self.entries = OrderedDict()  # key -> cached value (a surface or list of surfaces)
+        self.users = {}  # key -> WeakSet of objects that hold on to the cached value
+        self.tracker.register_evictor(category, self.evict_unused)
+
+    def add_user(self, key, user):
+        """Record that `user` keeps the value for key; it stays cached while `user` is alive."""
+        if user is not None:
+            self.users.setdefault(key, weakref.WeakSet()).add(user)
+
+    def get(self, key, user=None):
+        """Return the cached value for key, or None if it isn't cached."""
+        value = self.entries.get(key)
+        if value is not None:
+            self.entries.move_to_end(key)  # Mark as recently used
+            self.add_user(key, user)
+        return value
+
+    def put(self, key, value, owner, user=None):
+        """
+        Cache a surface (or list of surfaces) under key and start tracking it.
+
+        :param owner: Name the surfaces are reported under
+        :param user: Object that keeps the value (see add_user); entries without
+                     a living user can be evicted when the category is over budget
+        """
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        self.add_user(key, user)
+        surfaces = value if isinstance(value, list) else [value]
+        for surface in surfaces:
+            self.tracker.track(surface, owner, self.category, enforce=False)
+        self.tracker.enforce_budget(self.category)
+        return value
+
+    def evict_unused(self):
+        """
+        Drop the least-recently-used entry that has no living users.
+        Returns False if every entry is in use, since evicting those wouldn't free
+        anything and would only cause duplicate copies on the next load.
+        """
+        for key in self.entries:
+            if not self.users.get(key):
+                del self.entries[key]
+                self.users.pop(key, None)
+                return True
+        return False
+
+    def clear(self):
+        """Drop every cached entry."""
+        self.entries.clear()
+        self.users.clear()
+
+
+def format_bytes(size):
+    """Format a byte count as a short human readable string."""
+    if size >= 1024 * 1024:
+        return f"{size / (1024 * 1024):.1f} MB"
+    if size >= 1024:
+        return f"{size / 1024:.1f} KB"
+    return f"{size} B"
+
+
+# Shared tracker used by the loaders, caches and scenes
+memory_tracker = MemoryTracker()
@@ -0,0 +1,134 @@
+# core/renderer.py
+
+import pygame
+from settings import SCREEN_WIDTH, SCREEN_HEIGHT, BG_COLOR, ZOOM, RENDER_SCALE, RENDER_ACCELERATED
+from core.memory import memory_tracker
+
+WINDOW_TITLE = "Simple Dungeon Crawler"
+
+
+class LegacyRenderer:
+    """
+    The original path: everything is drawn straight to the window, and the
+    camera zoom is applied separately to the dungeon and to sprite positions.
+    """
+
+    name = "legacy"
+
+    def __init__(self):
+        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        pygame.display.set_caption(WINDOW_TITLE)
+        self.world = self.screen  # Surface the world is drawn to
+        self.ui = self.screen  # Surface the HUD is drawn to, in window pixels
+        self.zoom = ZOOM  # Zoom the camera applies to world positions
+        self.view_size = (SCREEN_WIDTH, SCREEN_HEIGHT)  # Size of self.world
+
+    def begin_frame(self):
+        """Clear the window for a new frame."""
+        self.screen.fill(BG_COLOR)
+
+    def upscale(self):
+        """Called once the world is drawn, before the HUD. Nothing to do here."""
+
+    def present(self):
+        """Show the finished frame."""
+        pygame.display.flip()
+
+
+class NativeRenderer(LegacyRenderer):
+    """
+    Draws the world at native pixel-art resolution into one internal surface,
+    then scales it to the window once per frame by a whole number (RENDER_SCALE).
+    """
+
+    name = "native"
+
+    def __init__(self, scale=RENDER_SCALE):
+        super().__init__()
+        self.scale = scale
+        self.zoom = 1  # The world is drawn unzoomed; the upscale does the zooming
+        self.view_size = (SCREEN_WIDTH // scale, SCREEN_HEIGHT // scale)
+        self.world = memory_tracker.track(
+            pygame.Surface(self.view_size).convert(), "NativeRenderer", "render")
+
+        # Scale straight into the window, centered if the size doesn't divide evenly
+        target_rect = pygame.Rect(0, 0, self.view_size[0] * scale, self.view_size[1] * scale)
+        target_rect.center = self.screen.get_rect().center
+        self.target = self.screen.subsurface(target_rect)
+        self.letterboxed = target_rect.size != self.screen.get_size()
+
+    def begin_frame(self):
+        if self.letterboxed:
+            self.screen.fill(BG_COLOR)  # Only the borders aren't covered by the upscale
+        self.world.fill(BG_COLOR)
+
+    def upscale(self):
+        """Scale the finished world onto the window, without allocating a new surface."""
+        pygame.transform.scale(self.world, self.target.get_size(), self.target)
+
+
+class TextureRenderer:
+    """
+    Draws the world like NativeRenderer, but uploads it to an SDL2 texture and
+    lets the SDL renderer do the upscale. Uses the software renderer unless
+    RENDER_ACCELERATED is set.
+    """
+
+    name = "texture"
+
+    def __init__(self, scale=RENDER_SCALE, accelerated=RENDER_ACCELERATED):
+        from pygame._sdl2.video import Window, Renderer, Texture
+
+        # A hidden display is still needed so images can be converted when loaded
+        pygame.display.set_mode((1, 1), pygame.HIDDEN)
+        self.window = Window(WINDOW_TITLE, size=(SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.renderer = Renderer(self.window, accelerated=1 if accelerated else 0)
+
+        self.scale = scale
+        self.zoom = 1
+        self.view_size = (SCREEN_WIDTH // scale, SCREEN_HEIGHT // scale)
+        self.world = memory_tracker.track(
+            pygame.Surface(self.view_size).convert(), "TextureRenderer", "render")
+        self.ui = memory_tracker.track(
+            pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA), "TextureRenderer", "render")
+
+        self.world_texture = Texture(self.renderer, self.view_size, streaming=True)
+        self.ui_texture = Texture(self.renderer, (SCREEN_WIDTH, SCREEN_HEIGHT), streaming=True)
+        self.ui_texture.blend_mode = pygame.BLENDMODE_BLEND
+
+        target_rect = pygame.Rect(0, 0, self.view_size[0] * scale, self.view_size[1] * scale)
+        target_rect.center = (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
+        self.target_rect = target_rect
+
+    def begin_frame(self):
+        self.world.fill(BG_COLOR)
+        self.ui.fill((0, 0, 0, 0))
+
+    def upscale(self):
+        """Nothing to do yet; the GPU (or software renderer) scales the texture in present."""
+
+    def present(self):
+        """Upload the world and HUD, draw them and show the frame."""
+        self.renderer.draw_color = BG_COLOR + (255,)
+        self.renderer.clear()
+
+        self.world_texture.update(self.world)
+        self.world_texture.draw(dstrect=self.target_rect)
+        self.ui_texture.update(self.ui)
+        self.ui_texture.draw()
+
+        self.renderer.present()
+
+
+RENDERERS = {
+    LegacyRenderer.name: LegacyRenderer,
+    NativeRenderer.name: NativeRenderer,
+    TextureRenderer.name: TextureRenderer,
+}
+
+
+def create_renderer(name):
+    """Create the renderer with the given name ('legacy', 'native' or 'texture')."""
+    if name not in RENDERERS:
+        raise ValueError(f"Unknown renderer '{name}', expected one of {', '.join(RENDERERS)}")
+    return RENDERERS[name]()
@@ -0,0 +1,211 @@
+# core/scheduler.py
+
+import time
+from collections import deque
+from settings import UPDATE_BUDGET_MS, LOD_DISTANCES, MAX_DEFERRED_FRAMES
+
+# How quickly measured costs replace the declared estimate (0-1, higher = faster)
+COST_SMOOTHING = 0.2
+
+
+class ScheduledTask:
+    """A system or entity update that runs every `interval` frames."""
+
+    def __init__(self, name, callback, interval=1, cost_ms=0.0, essential=False, position=None):
+        """
+        :param name: Unique name shown in the instrumentation
+        :param callback: Function called with no arguments when the task runs
+        :param interval: Run every N frames (before level of detail is applied)
+        :param cost_ms: Estimated milliseconds per run; replaced by measurements over time
+        :param essential: Essential tasks always run on time and ignore the budget
+        :param position: Optional function returning the (x, y) world position, used for level of detail
+        """
+        self.name = name
+        self.callback = callback
+        self.interval = interval
+        self.cost_ms = cost_ms
+        self.essential = essential
+        self.position = position
+        self.next_frame = 0  # First frame the task is due again
+        self.deferred_frames = 0  # Frames the task has been due but didn't fit the budget
+
+
+class Job:
+    """A one-off piece of expensive work (an AI decision, a path request, ...)."""
+
+    def __init__(self, name, callback, cost_ms):
+        self.name = name
+        self.callback = callback
+        self.cost_ms = cost_ms
+        self.deferred_frames = 0
+
+
+class FrameStats:
+    """What the scheduler did during one frame."""
+
+    def __init__(self, frame, budget_ms):
+        self.frame = frame
+        self.budget_ms = budget_ms
+        self.used_ms = 0.0
+        self.ran = []        # Names of tasks and jobs that ran
+        self.deferred = []   # Names that were due but pushed to a later frame
+        self.reduced = 0     # Tasks running at a reduced rate because they are far from the camera
+
+
+class Scheduler:
+    """
+    Runs updates within a per-frame millisecond budget.
+
+    Essential tasks run every time they are due. Optional tasks and queued
+    jobs compete for the rest of the budget, most overdue first, and tasks far
+    from the camera run less often (see LOD_DISTANCES). At most one piece of
+    work that has waited MAX_DEFERRED_FRAMES is let through per frame over budget.
+    """
+
+    def __init__(self, budget_ms=UPDATE_BUDGET_MS):
+        self.budget_ms = budget_ms
+        self.tasks = {}  # name -> ScheduledTask
+        self.jobs = deque()
+        self.frame = 0
+        self.last_stats = FrameStats(0, budget_ms)
+
+        # Totals since the scheduler was created
+        self.frames = 0
+        self.total_used_ms = 0.0
+        self.over_budget_frames = 0
+        self.deferred_counts = {}  # name -> number of times it was deferred
+        self.reduced_runs = 0  # Task runs at a reduced rate because of distance
+        self.forced_runs = 0  # Runs let through over budget because they waited too long
+
+    def add(self, name, callback, interval=1, cost_ms=0.0, essential=False, position=None):
+        """Schedule a recurring task (replacing any task with the same name)."""
+        task = ScheduledTask(name, callback, interval, cost_ms, essential, position)
+        task.next_frame = self.frame
+        self.tasks[name] = task
+        return task
+
+    def add_entity(self, name, entity):
+        """Schedule entity.update using the entity's declared update_interval and update_cost_ms."""
+        return self.add(name, entity.update,
+                        interval=getattr(entity, "update_interval", 1),
+                        cost_ms=getattr(entity, "update_cost_ms", 0.0),
+                        position=lambda: (entity.x, entity.y))
+
+    def remove(self, name):
+        """Stop running a task."""
+        self.tasks.pop(name, None)
+
+    def queue_job(self, name, callback, cost_ms):
+        """Queue one-off work to run on the first frame with enough budget left."""
+        self.jobs.append(Job(name, callback, cost_ms))
+
+    def lod_multiplier(self, task, camera):
+        """Return how many times less often a task should run given its distance from the camera."""
+        if task.position is None or camera is None:
+            return 1
+        x, y = task.position()
+        center_x, center_y = camera.world_center()
+        distance = ((x - center_x) ** 2 + (y - center_y) ** 2) ** 0.5
+        for max_distance, multiplier in LOD_DISTANCES:
+            if distance <= max_distance:
+                return multiplier
+        return LOD_DISTANCES[-1][1]
+
+    def run(self, camera=None):
+        """Run this frame's due tasks and queued jobs, then return the FrameStats."""
+        stats = FrameStats(self.frame, self.budget_ms)
+        start = time.perf_counter()
+
+        due = [task for task in self.tasks.values() if task.next_frame <= self.frame]
+        essential = [task for task in due if task.essential]
+        optional = [task for task in due if not task.essential]
+
+        for task in essential:
+            self.run_task(task, camera, stats)
+
+        # Tasks and jobs share the budget, most overdue first so deferred work
+        # isn't starved by newer work (the sort is stable, so jobs stay in order)
+        candidates = optional + list(self.jobs)
+        candidates.sort(key=lambda work: -work.deferred_frames)
+        forced = False
+        finished_jobs = set()
+        for work in candidates:
+            if self.fits(work, start):
+                pass
+            elif work.deferred_frames >= MAX_DEFERRED_FRAMES and not forced:
+                # Let one starved piece of work through per frame, so nothing
+                # waits forever but overdue work doesn't all land on one frame
+                forced = True
+                self.forced_runs += 1
+            else:
+                self.defer(work, stats)
+                continue
+
+            if isinstance(work, Job):
+                self.run_job(work, stats)
+                finished_jobs.add(id(work))
+            else:
+                self.run_task(work, camera, stats)
+
+        if finished_jobs:
+            self.jobs = deque(job for job in self.jobs if id(job) not in finished_jobs)
+
+        stats.used_ms = (time.perf_counter() - start) * 1000
+        self.record(stats)
+        self.frame += 1
+        return stats
+
+    def fits(self, work, start):
+        """Check if the estimated cost of a task or job fits what's left of the budget."""
+        used_ms = (time.perf_counter() - start) * 1000
+        return used_ms + work.cost_ms <= self.budget_ms
+
+    def run_task(self, task, camera, stats):
+        """Run a task, measure it and work out when it's next due."""
+        multiplier = self.lod_multiplier(task, camera)
+        if multiplier > 1:
+            stats.reduced += 1
+            self.reduced_runs += 1
+
+        task_start = time.perf_counter()
+        task.callback()
+        elapsed = (time.perf_counter() - task_start) * 1000
+        task.cost_ms += (elapsed - task.cost_ms) * COST_SMOOTHING
+
+        task.deferred_frames = 0
+        task.next_frame = self.frame + task.interval * multiplier
+        stats.ran.append(task.name)
+
+    def run_job(self, job, stats):
+        """Run a queued job."""
+        job.callback()
+        stats.ran.append(job.name)
+
+    def defer(self, work, stats):
+        """Push a task or job to a later frame."""
+        work.deferred_frames += 1
+        stats.deferred.append(work.name)
+        self.deferred_counts[work.name] = self.deferred_counts.get(work.name, 0) + 1
+
+    def record(self, stats):
+        """Add a frame's stats to the running totals."""
+        self.last_stats = stats
+        self.frames += 1
+        self.total_used_ms += stats.used_ms
+        if stats.used_ms > self.budget_ms:
+            self.over_budget_frames += 1
+
+    def report(self):
+        """Return a list of text lines describing budget use and deferred work."""
+        stats = self.last_stats
+        average = self.total_used_ms / self.frames if self.frames else 0.0
+        lines = [
+            f"update: {stats.used_ms:.2f} / {self.budget_ms:.2f} ms "
+            f"({len(stats.ran)} ran, {len(stats.deferred)} deferred, {stats.reduced} reduced)",
+            f"update avg: {average:.2f} ms, over budget {self.over_budget_frames}/{self.frames} frames, "
+            f"{len(self.jobs)} jobs queued",
+            f"reduced rate runs: {self.reduced_runs}, forced over budget: {self.forced_runs}",
+        ]
+        if stats.deferred:
+            lines.append("deferred: " + ", ".join(stats.deferred))
+        return lines
@@ -1,8 +1,27 @@
 # utils.py
 
 import pygame
+from core.memory import SurfaceCache
 
-def load_image(path, scale=(40, 40)):
-    """Load an image from the specified path and scale it to the given size."""
-    image = pygame.image.load(path).convert_alpha()
-    return pygame.transform.scale(image, scale)
+# Scaled images shared by everything that loads the same path at the same size
+image_cache = SurfaceCache("images")
+
+def load_image(path, scale=None, colorkey=None, user=None):
+    """
+    Load an image from the specified path and scale it to the given size
+    (or keep its source size if scale is None).
+
+    The returned surface is shared with every other caller asking for the same
+    path, size and colorkey, so copy it before changing it. Pass the object that
+    keeps the image as `user` so it isn't evicted from the cache while in use.
+    """
+    key = (path, tuple(scale) if scale is not None else None, colorkey)
+    image = image_cache.get(key, user)
+    if image is None:
+        image = pygame.image.load(path).convert_alpha()
+        if scale is not None:
+            image = pygame.transform.scale(image, scale)
+        if colorkey is not None:
+            image.set_colorkey(colorkey)
+        image = image_cache.put(key, image, owner=path, user=user)
+    return image
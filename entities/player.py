@@ -1,6 +1,7 @@
 import pygame
-from settings import TILE_SIZE, HALF_TILE_SIZE, PLAYER_COLOR, DUNGEON_MAP, OFFSET_X, OFFSET_Y
+from settings import TILE_SIZE, HALF_TILE_SIZE, PLAYER_COLOR, OFFSET_X, OFFSET_Y
 from entities.spritesheet import SpriteStripAnim  # Import the SpriteStripAnim class
+from core.dungeon import can_move_to
 
 class Player:
     def __init__(self, x, y, speed=2, max_health=100):
@@ -9,6 +10,10 @@ class Player:
         self.y = y * TILE_SIZE + (TILE_SIZE - HALF_TILE_SIZE) // 2
         self.speed = speed
 
+        # Update scheduling (see core/scheduler.py)
+        self.update_interval = 1  # Update every frame when near the camera
+        self.update_cost_ms = 0.05  # Rough cost of one update, refined by the scheduler
+
         # Health
         self.max_health = max_health
         self.current_health = max_health  # Start with full health
@@ -71,15 +76,7 @@ class Player:
 
     def can_move_to(self, new_x, new_y):
         """Check if the player can move to the specified pixel coordinates."""
-        left_tile = int(new_x / TILE_SIZE)
-        right_tile = int((new_x + HALF_TILE_SIZE - 1) / TILE_SIZE)
-        top_tile = int(new_y / TILE_SIZE)
-        bottom_tile = int((new_y + HALF_TILE_SIZE - 1) / TILE_SIZE)
-
-        return (DUNGEON_MAP[top_tile][left_tile] == 0 and
-                DUNGEON_MAP[top_tile][right_tile] == 0 and
-                DUNGEON_MAP[bottom_tile][left_tile] == 0 and
-                DUNGEON_MAP[bottom_tile][right_tile] == 0)
+        return can_move_to(new_x, new_y, HALF_TILE_SIZE)
 
     def take_damage(self, amount):
         """Reduce the player's health by the specified amount."""
@@ -182,17 +179,11 @@ class Player:
             if self.can_move_to(self.x, new_y):
                 self.y = new_y
 
-    def draw(self, surface, camera):
-        """Draw the player and health bar on the screen."""
-        # Update animation frame
-        self.update_animation()
-
+    def draw_sprite(self, surface, camera):
+        """Draw only the player's current animation frame (used for other players too)."""
         # Draw the current frame (idle, idle-dagger, walking, or punching)
         if self.current_frame is not None:
             frame_to_draw = pygame.transform.flip(self.current_frame, True, False) if self.last_direction == 'left' else self.current_frame
             frame_rect = frame_to_draw.get_rect(center=(self.x + HALF_TILE_SIZE // 2, self.y + HALF_TILE_SIZE // 2))
             frame_rect = camera.apply_to_rect(frame_rect)
             surface.blit(frame_to_draw, frame_rect)
-
-        # Draw the health bar on the screen (if not dead)
-        self.draw_health_bar(surface)
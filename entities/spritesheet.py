@@ -1,4 +1,8 @@
 import pygame
+from core.memory import SurfaceCache
+
+# Scaled animation frames, shared between every SpriteStripAnim using the same strip
+strip_cache = SurfaceCache("sprites")
 
 class spritesheet:
     def __init__(self, filename):
@@ -31,7 +35,7 @@ class spritesheet:
 class SpriteStripAnim:
     """Sprite strip animator with Python iterator protocol."""
 
-    def __init__(self, filename, rect, count, colorkey=None, loop=False, frames=1, target_size=(35,35)):
+    def __init__(self, filename, rect, count, colorkey=None, loop=False, frames=1, target_size=None):
         """
         filename: path to the spritesheet image
         rect: rectangle specifying the location and size of the first frame
@@ -42,12 +46,17 @@ class SpriteStripAnim:
         target_size: (width, height) tuple for resizing each frame (optional)
         """
         self.filename = filename
-        ss = spritesheet(filename)
-        self.images = ss.load_strip(rect, count, colorkey)
+        key = (filename, tuple(rect), count, colorkey, target_size)
+        self.images = strip_cache.get(key, user=self)
+
+        if self.images is None:
+            ss = spritesheet(filename)
+            images = ss.load_strip(rect, count, colorkey)
 
-        # Resize frames if target_size is specified
-        if target_size is not None:
-            self.images = [pygame.transform.scale(img, target_size) for img in self.images]
+            # Resize frames if target_size is specified
+            if target_size is not None:
+                images = [pygame.transform.scale(img, target_size) for img in images]
+            self.images = strip_cache.put(key, images, owner=filename, user=self)
 
         self.i = 0
         self.loop = loop
@@ -1,14 +1,31 @@
 # main.py
 
+import argparse
 import pygame
 from scenes.main_scene import MainScene
+from net.client import ClientThread
+from core.renderer import RENDERERS
+from settings import RENDER_BACKEND
 
 def main():
+    parser = argparse.ArgumentParser(description="Simple Dungeon Crawler")
+    parser.add_argument("--connect", metavar="HOST:PORT",
+                        help="Join a co-op server (see server.py) instead of playing alone")
+    parser.add_argument("--renderer", choices=list(RENDERERS), default=RENDER_BACKEND,
+                        help="Render backend (default from settings.RENDER_BACKEND)")
+    args = parser.parse_args()
+
     # Initialize pygame
     pygame.init()
 
+    # Connect to the co-op server if asked to
+    client = None
+    if args.connect:
+        host, port = args.connect.rsplit(":", 1)
+        client = ClientThread(host, int(port))
+
     # Run the main scene (game loop)
-    main_scene = MainScene()
+    main_scene = MainScene(client, renderer=args.renderer)
     main_scene.run()
 
 if __name__ == "__main__":
@@ -0,0 +1,125 @@
+# net/client.py
+
+import asyncio
+import threading
+from collections import OrderedDict
+from settings import SNAPSHOT_HISTORY
+from net import protocol
+
+JOIN_RETRY_INTERVAL = 0.25  # Seconds between join attempts while waiting for a welcome
+
+
+class GameClient(asyncio.DatagramProtocol):
+    """Sends inputs to a GameServer and rebuilds the world from its snapshots."""
+
+    def __init__(self):
+        self.transport = None
+        self.player_id = None
+        self.tick_rate = None
+        self.welcomed = None  # Future resolved when the server assigns a player
+        self.input_seq = 0
+        self.latest_tick = protocol.NO_TICK  # Newest snapshot decoded, sent back as the ack
+        self.snapshots = OrderedDict()  # tick -> decoded state, kept as delta baselines
+        self.state = {}  # (kind, id) -> (x, y, health, flags) from the newest snapshot
+        self.bytes_received = 0
+        self.snapshots_dropped = 0  # Snapshots whose baseline we no longer had
+
+    def connection_made(self, transport):
+        self.transport = transport
+        self.welcomed = asyncio.get_running_loop().create_future()
+
+    def datagram_received(self, data, addr):
+        if not data:
+            return
+        self.bytes_received += len(data)
+        msg_type = data[0]
+
+        if msg_type == protocol.MSG_WELCOME and not self.welcomed.done():
+            self.player_id, self.tick_rate = protocol.decode_welcome(data)
+            self.welcomed.set_result(self.player_id)
+        elif msg_type == protocol.MSG_SNAPSHOT:
+            self.handle_snapshot(data)
+
+    def handle_snapshot(self, data):
+        """Decode a snapshot against the baseline it was built from and store it."""
+        try:
+            tick, base_tick = protocol.read_snapshot_header(data)
+            if self.latest_tick != protocol.NO_TICK and not protocol.tick_newer(tick, self.latest_tick):
+                return  # Late packet; we already have something newer
+
+            if base_tick == protocol.NO_TICK:
+                baseline = {}
+            elif base_tick in self.snapshots:
+                baseline = self.snapshots[base_tick]
+            else:
+                self.snapshots_dropped += 1
+                return
+
+            tick, state = protocol.decode_snapshot(data, baseline)
+        except ValueError:
+            self.snapshots_dropped += 1
+            return
+
+        self.snapshots[tick] = state
+        while len(self.snapshots) > SNAPSHOT_HISTORY:
+            self.snapshots.popitem(last=False)
+        self.latest_tick = tick
+        self.state = state
+
+    async def join(self, timeout=5.0):
+        """Keep asking the server for a player until it answers. Returns the player id."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while not self.welcomed.done():
+            if loop.time() > deadline:
+                raise TimeoutError("No response from the server")
+            self.transport.sendto(protocol.encode_join())
+            try:
+                await asyncio.wait_for(asyncio.shield(self.welcomed), JOIN_RETRY_INTERVAL)
+            except asyncio.TimeoutError:
+                pass
+        return self.player_id
+
+    def send_input(self, dx, dy, buttons=0):
+        """Send the current movement and buttons, acknowledging the newest snapshot."""
+        self.input_seq = (self.input_seq + 1) & protocol.NO_TICK
+        self.transport.sendto(protocol.encode_input(self.input_seq, self.latest_tick, dx, dy, buttons))
+
+    def leave(self):
+        """Tell the server we're going and close the socket."""
+        self.transport.sendto(protocol.encode_leave())
+        self.transport.close()
+
+
+async def connect(host, port):
+    """Open a UDP socket to the server, join the game and return the GameClient."""
+    loop = asyncio.get_running_loop()
+    _transport, client = await loop.create_datagram_endpoint(GameClient, remote_addr=(host, port))
+    await client.join()
+    return client
+
+
+class ClientThread:
+    """Runs a GameClient on a background event loop so the pygame loop can stay synchronous."""
+
+    def __init__(self, host, port):
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self.thread.start()
+        self.client = asyncio.run_coroutine_threadsafe(connect(host, port), self.loop).result()
+
+    @property
+    def player_id(self):
+        return self.client.player_id
+
+    @property
+    def state(self):
+        """The newest world state (replaced whole on each snapshot, so it's safe to read)."""
+        return self.client.state
+
+    def send_input(self, dx, dy, buttons=0):
+        self.loop.call_soon_threadsafe(self.client.send_input, dx, dy, buttons)
+
+    def close(self):
+        self.loop.call_soon_threadsafe(self.client.leave)
+        self.loop.call_soon_threadsafe(self.loop.stop)
@@ -0,0 +1,271 @@
+# net/protocol.py
+
+# Message types (first byte of every datagram)
+MSG_JOIN = 1      # Client -> server: ask for a player
+MSG_WELCOME = 2   # Server -> client: player id assigned to the client
+MSG_INPUT = 3     # Client -> server: movement, buttons and the last snapshot tick received
+MSG_SNAPSHOT = 4  # Server -> client: world state, delta-compressed against an acked snapshot
+MSG_LEAVE = 5     # Client -> server: the client is disconnecting
+
+# Entity kinds
+KIND_PLAYER = 0
+KIND_ITEM = 1
+
+# Item ids
+DAGGER_ITEM_ID = 0
+
+# Input buttons
+BUTTON_PUNCH = 1
+BUTTON_INTERACT = 2
+
+# Entity state flags
+FLAG_MOVING = 1
+FLAG_PUNCHING = 2
+FLAG_FACING_LEFT = 4
+FLAG_DEAD = 8
+FLAG_HAS_DAGGER = 16
+
+# Field sizes in bits
+TICK_BITS = 16
+NO_TICK = (1 << TICK_BITS) - 1  # Sent as the base/ack tick when there is none
+ID_BITS = 8
+COUNT_BITS = 8
+POSITION_SCALE = 4    # Positions are sent in quarter pixels
+POSITION_BITS = 14    # Up to 4096 world pixels
+SMALL_DELTA_BITS = 7  # Signed position change that fits without a full value
+HEALTH_BITS = 7
+FLAG_BITS = 5
+
+# Bits in the per-entity change mask
+CHANGED_X = 1
+CHANGED_Y = 2
+CHANGED_HEALTH = 4
+CHANGED_FLAGS = 8
+MASK_BITS = 4
+
+# Baseline used for entities the other side hasn't seen yet
+EMPTY_STATE = (0, 0, 0, 0)
+
+
+class BitWriter:
+    """Packs unsigned integers of arbitrary bit widths into bytes."""
+
+    def __init__(self):
+        self.data = bytearray()
+        self.acc = 0  # Bits waiting to be flushed to data
+        self.acc_bits = 0
+
+    def write(self, value, bits):
+        """Append the lowest `bits` bits of value."""
+        self.acc = (self.acc << bits) | (value & ((1 << bits) - 1))
+        self.acc_bits += bits
+        while self.acc_bits >= 8:
+            self.acc_bits -= 8
+            self.data.append((self.acc >> self.acc_bits) & 0xFF)
+        self.acc &= (1 << self.acc_bits) - 1
+
+    def to_bytes(self):
+        """Return the packed bytes, padding the last byte with zeros."""
+        if self.acc_bits:
+            return bytes(self.data) + bytes([(self.acc << (8 - self.acc_bits)) & 0xFF])
+        return bytes(self.data)
+
+
+class BitReader:
+    """Reads unsigned integers written by a BitWriter."""
+
+    def __init__(self, data, offset=0):
+        self.data = data
+        self.pos = offset  # Index of the next byte to load
+        self.acc = 0
+        self.acc_bits = 0
+
+    def read(self, bits):
+        """Read the next `bits` bits as an unsigned integer."""
+        while self.acc_bits < bits:
+            if self.pos >= len(self.data):
+                raise ValueError("Packet ended before all fields were read")
+            self.acc = (self.acc << 8) | self.data[self.pos]
+            self.pos += 1
+            self.acc_bits += 8
+        self.acc_bits -= bits
+        value = self.acc >> self.acc_bits
+        self.acc &= (1 << self.acc_bits) - 1
+        return value
+
+
+def quantize(value):
+    """Convert a world pixel coordinate to the integer sent over the wire."""
+    return max(0, min((1 << POSITION_BITS) - 1, round(value * POSITION_SCALE)))
+
+
+def dequantize(value):
+    """Convert a wire coordinate back to world pixels."""
+    return value / POSITION_SCALE
+
+
+def tick_newer(a, b):
+    """Check if 16-bit tick/sequence a comes after b, allowing for wraparound."""
+    return a != b and ((a - b) & NO_TICK) < (1 << (TICK_BITS - 1))
+
+
+def encode_join():
+    return bytes([MSG_JOIN])
+
+
+def encode_leave():
+    return bytes([MSG_LEAVE])
+
+
+def encode_welcome(player_id, tick_rate):
+    return bytes([MSG_WELCOME, player_id, tick_rate])
+
+
+def decode_welcome(data):
+    """Return (player_id, tick_rate) from a welcome message."""
+    return data[1], data[2]
+
+
+def encode_input(seq, ack, dx, dy, buttons):
+    """
+    Pack a client input.
+
+    :param seq: Input sequence number, so the server can drop stale inputs
+    :param ack: Tick of the newest snapshot the client has decoded (NO_TICK if none)
+    :param dx: Horizontal movement (-1, 0 or 1)
+    :param dy: Vertical movement (-1, 0 or 1)
+    :param buttons: BUTTON_* flags held this frame
+    """
+    writer = BitWriter()
+    writer.write(seq, TICK_BITS)
+    writer.write(ack, TICK_BITS)
+    writer.write(dx + 1, 2)
+    writer.write(dy + 1, 2)
+    writer.write(buttons, 2)
+    return bytes([MSG_INPUT]) + writer.to_bytes()
+
+
+def decode_input(data):
+    """Return (seq, ack, dx, dy, buttons) from an input message."""
+    reader = BitReader(data, 1)
+    seq = reader.read(TICK_BITS)
+    ack = reader.read(TICK_BITS)
+    dx = reader.read(2) - 1
+    dy = reader.read(2) - 1
+    buttons = reader.read(2)
+    return seq, ack, dx, dy, buttons
+
+
+def write_position(writer, value, base):
+    """Write a position as a small signed delta from base when it fits, else in full."""
+    delta = value - base
+    half = 1 << (SMALL_DELTA_BITS - 1)
+    if -half <= delta < half:
+        writer.write(1, 1)
+        writer.write(delta, SMALL_DELTA_BITS)
+    else:
+        writer.write(0, 1)
+        writer.write(value, POSITION_BITS)
+
+
+def read_position(reader, base):
+    """Read a position written by write_position."""
+    if reader.read(1):
+        delta = reader.read(SMALL_DELTA_BITS)
+        if delta >= 1 << (SMALL_DELTA_BITS - 1):
+            delta -= 1 << SMALL_DELTA_BITS
+        return base + delta
+    return reader.read(POSITION_BITS)
+
+
+def encode_snapshot(tick, base_tick, state, baseline):
+    """
+    Pack a world snapshot as a delta against a snapshot the client already has.
+
+    :param tick: Tick this snapshot describes
+    :param base_tick: Tick of the baseline (NO_TICK to send everything)
+    :param state: Dict of (kind, id) -> (x, y, health, flags) visible to the client
+    :param baseline: The state the client acknowledged for base_tick ({} if none)
+    """
+    changed = []
+    for key, values in state.items():
+        base = baseline.get(key, EMPTY_STATE)
+        if key not in baseline or values != base:
+            changed.append((key, values, base))
+    removed = [key for key in baseline if key not in state]
+
+    writer = BitWriter()
+    writer.write(tick, TICK_BITS)
+    writer.write(base_tick, TICK_BITS)
+
+    writer.write(len(changed), COUNT_BITS)
+    for (kind, entity_id), (x, y, health, flags), (base_x, base_y, base_health, base_flags) in changed:
+        writer.write(kind, 1)
+        writer.write(entity_id, ID_BITS)
+
+        mask = 0
+        if x != base_x:
+            mask |= CHANGED_X
+        if y != base_y:
+            mask |= CHANGED_Y
+        if health != base_health:
+            mask |= CHANGED_HEALTH
+        if flags != base_flags:
+            mask |= CHANGED_FLAGS
+        writer.write(mask, MASK_BITS)
+
+        if mask & CHANGED_X:
+            write_position(writer, x, base_x)
+        if mask & CHANGED_Y:
+            write_position(writer, y, base_y)
+        if mask & CHANGED_HEALTH:
+            writer.write(health, HEALTH_BITS)
+        if mask & CHANGED_FLAGS:
+            writer.write(flags, FLAG_BITS)
+
+    writer.write(len(removed), COUNT_BITS)
+    for kind, entity_id in removed:
+        writer.write(kind, 1)
+        writer.write(entity_id, ID_BITS)
+
+    return bytes([MSG_SNAPSHOT]) + writer.to_bytes()
+
+
+def read_snapshot_header(data):
+    """Return (tick, base_tick) without decoding the rest of the snapshot."""
+    reader = BitReader(data, 1)
+    return reader.read(TICK_BITS), reader.read(TICK_BITS)
+
+
+def decode_snapshot(data, baseline):
+    """
+    Rebuild the full visible state from a snapshot and its baseline.
+
+    :param data: The snapshot datagram
+    :param baseline: The state the client stored for the snapshot's base tick
+    :return: (tick, state) where state is a dict like the one given to encode_snapshot
+    """
+    reader = BitReader(data, 1)
+    tick = reader.read(TICK_BITS)
+    reader.read(TICK_BITS)  # Base tick, already used to pick the baseline
+
+    state = dict(baseline)
+    for _ in range(reader.read(COUNT_BITS)):
+        key = (reader.read(1), reader.read(ID_BITS))
+        x, y, health, flags = state.get(key, EMPTY_STATE)
+        mask = reader.read(MASK_BITS)
+
+        if mask & CHANGED_X:
+            x = read_position(reader, x)
+        if mask & CHANGED_Y:
+            y = read_position(reader, y)
+        if mask & CHANGED_HEALTH:
+            health = reader.read(HEALTH_BITS)
+        if mask & CHANGED_FLAGS:
+            flags = reader.read(FLAG_BITS)
+        state[key] = (x, y, health, flags)
+
+    for _ in range(reader.read(COUNT_BITS)):
+        state.pop((reader.read(1), reader.read(ID_BITS)), None)
+
+    return tick, state
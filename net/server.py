@@ -0,0 +1,257 @@
+# net/server.py
+
+import time
+import asyncio
+from collections import OrderedDict
+from settings import (TILE_SIZE, HALF_TILE_SIZE, FPS, ZOOM, RENDER_SCALE, SCREEN_WIDTH, SCREEN_HEIGHT,
+                      SERVER_TICK_RATE, CLIENT_TIMEOUT, SNAPSHOT_HISTORY, INTEREST_MARGIN)
+from core.dungeon import can_move_to
+from net import protocol
+
+MAX_PLAYERS = 250  # Player ids must fit in protocol.ID_BITS
+PUNCH_TICKS = SERVER_TICK_RATE // 3  # How long a punch lasts on the server
+
+
+class ServerPlayer:
+    """Headless player state owned by the server."""
+
+    def __init__(self, player_id, x, y, speed=1.2, max_health=100):
+        self.player_id = player_id
+        self.x = x * TILE_SIZE + (TILE_SIZE - HALF_TILE_SIZE) // 2
+        self.y = y * TILE_SIZE + (TILE_SIZE - HALF_TILE_SIZE) // 2
+        # Player speeds are in pixels per client frame, so scale them to server ticks
+        self.speed = speed * FPS / SERVER_TICK_RATE
+        self.health = max_health
+        self.is_moving = False
+        self.punch_ticks = 0
+        self.last_direction = 'right'
+        self.has_dagger = False
+
+    def move(self, dx, dy):
+        """Move one tick in the given direction, stopping at walls."""
+        if self.health == 0:
+            return
+
+        self.is_moving = dx != 0 or dy != 0
+        if dx > 0:
+            self.last_direction = 'right'
+        elif dx < 0:
+            self.last_direction = 'left'
+
+        if dx != 0:
+            new_x = self.x + dx * self.speed
+            if can_move_to(new_x, self.y):
+                self.x = new_x
+        if dy != 0:
+            new_y = self.y + dy * self.speed
+            if can_move_to(self.x, new_y):
+                self.y = new_y
+
+    def flags(self):
+        """Return the protocol flags describing this player's state."""
+        flags = 0
+        if self.is_moving:
+            flags |= protocol.FLAG_MOVING
+        if self.punch_ticks > 0:
+            flags |= protocol.FLAG_PUNCHING
+        if self.last_direction == 'left':
+            flags |= protocol.FLAG_FACING_LEFT
+        if self.health == 0:
+            flags |= protocol.FLAG_DEAD
+        if self.has_dagger:
+            flags |= protocol.FLAG_HAS_DAGGER
+        return flags
+
+
+class ClientConnection:
+    """Per-client bookkeeping: latest input, acked snapshot and sent history."""
+
+    def __init__(self, addr, player):
+        self.addr = addr
+        self.player = player
+        self.input = (0, 0, 0)  # (dx, dy, buttons) from the newest input
+        self.tick_buttons = 0  # Every button seen in any input since the last tick
+        self.last_buttons = 0  # Buttons held at the end of the previous tick, to detect presses
+        self.input_seq = None
+        self.last_seen = time.monotonic()
+        self.acked_tick = protocol.NO_TICK
+        self.history = OrderedDict()  # tick -> state sent to this client
+        self.bytes_sent = 0
+
+
+class GameServer(asyncio.DatagramProtocol):
+    """Authoritative server: owns the dungeon, players and items, and sends snapshots to clients."""
+
+    def __init__(self, tick_rate=SERVER_TICK_RATE):
+        self.tick_rate = tick_rate
+        self.tick = 0
+        self.transport = None
+        self.clients = {}  # addr -> ClientConnection
+        self.items = {protocol.DAGGER_ITEM_ID: (5 * TILE_SIZE, 5 * TILE_SIZE)}  # item id -> position
+        # Cover the widest view any of the client's renderers can show
+        view_zoom = min(ZOOM, RENDER_SCALE)
+        self.view_width = SCREEN_WIDTH / view_zoom + INTEREST_MARGIN * 2
+        self.view_height = SCREEN_HEIGHT / view_zoom + INTEREST_MARGIN * 2
+
+        # Stats for the budget report
+        self.tick_times = []  # Milliseconds spent in each tick
+        self.bytes_sent = 0
+        self.started = None
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def datagram_received(self, data, addr):
+        if not data:
+            return
+        msg_type = data[0]
+
+        if msg_type == protocol.MSG_JOIN:
+            self.handle_join(addr)
+        elif msg_type == protocol.MSG_INPUT and addr in self.clients:
+            self.handle_input(self.clients[addr], data)
+        elif msg_type == protocol.MSG_LEAVE:
+            self.clients.pop(addr, None)
+
+    def handle_join(self, addr):
+        """Create a player for a new client (or resend the welcome if it was lost)."""
+        client = self.clients.get(addr)
+        if client is None:
+            used_ids = {c.player.player_id for c in self.clients.values()}
+            free_ids = [i for i in range(MAX_PLAYERS) if i not in used_ids]
+            if not free_ids:
+                print(f"Server full, ignoring join from {addr}")
+                return
+            client = ClientConnection(addr, ServerPlayer(free_ids[0], x=1, y=1))
+            self.clients[addr] = client
+            print(f"Player {client.player.player_id} joined from {addr}")
+        self.transport.sendto(protocol.encode_welcome(client.player.player_id, self.tick_rate), addr)
+
+    def handle_input(self, client, data):
+        """Store the newest input from a client and note which snapshot it acknowledged."""
+        try:
+            seq, ack, dx, dy, buttons = protocol.decode_input(data)
+        except ValueError:
+            return  # Malformed packet
+        client.last_seen = time.monotonic()
+
+        # Clients send inputs faster than the server ticks, so remember every
+        # button seen until the next tick; otherwise a one-frame tap can be lost
+        client.tick_buttons |= buttons
+
+        # Inputs can arrive out of order over UDP; only keep the newest one
+        if client.input_seq is None or protocol.tick_newer(seq, client.input_seq):
+            client.input_seq = seq
+            client.input = (dx, dy, buttons)
+
+        if ack in client.history and (client.acked_tick == protocol.NO_TICK
+                                      or protocol.tick_newer(ack, client.acked_tick)):
+            client.acked_tick = ack
+            # Older snapshots can no longer be used as a baseline
+            while next(iter(client.history)) != ack:
+                client.history.popitem(last=False)
+
+    def step(self):
+        """Advance the simulation by one tick using each client's latest input."""
+        now = time.monotonic()
+        for addr, client in list(self.clients.items()):
+            if now - client.last_seen > CLIENT_TIMEOUT:
+                print(f"Player {client.player.player_id} timed out")
+                del self.clients[addr]
+
+        for client in self.clients.values():
+            player = client.player
+            dx, dy, buttons = client.input
+            pressed = client.tick_buttons & ~client.last_buttons
+            client.last_buttons = buttons
+            client.tick_buttons = 0
+
+            player.move(dx, dy)
+            if player.punch_ticks > 0:
+                player.punch_ticks -= 1
+            elif pressed & protocol.BUTTON_PUNCH and player.health > 0:
+                player.punch_ticks = PUNCH_TICKS
+            if pressed & protocol.BUTTON_INTERACT:
+                self.try_pick_up(player)
+
+    def try_pick_up(self, player):
+        """Give the player any item within reach (same reach as the single player game)."""
+        for item_id, (item_x, item_y) in list(self.items.items()):
+            if (abs(player.x - item_x) < TILE_SIZE + 15 and
+                    abs(player.y - item_y) < TILE_SIZE + 15):
+                del self.items[item_id]
+                if item_id == protocol.DAGGER_ITEM_ID:
+                    player.has_dagger = True
+
+    def world_state(self):
+        """Return (key, position, values) for every entity in the world."""
+        entities = []
+        for client in self.clients.values():
+            player = client.player
+            entities.append(((protocol.KIND_PLAYER, player.player_id), (player.x, player.y),
+                             (protocol.quantize(player.x), protocol.quantize(player.y),
+                              player.health, player.flags())))
+        for item_id, (x, y) in self.items.items():
+            entities.append(((protocol.KIND_ITEM, item_id), (x, y),
+                             (protocol.quantize(x), protocol.quantize(y), 0, 0)))
+        return entities
+
+    def visible_state(self, client, entities):
+        """Cull the world down to the entities inside the client's viewport (plus a margin)."""
+        left = client.player.x - self.view_width / 2
+        top = client.player.y - self.view_height / 2
+        own_key = (protocol.KIND_PLAYER, client.player.player_id)
+
+        state = {}
+        for key, (x, y), values in entities:
+            if key == own_key or (left <= x <= left + self.view_width and
+                                  top <= y <= top + self.view_height):
+                state[key] = values
+        return state
+
+    def send_snapshots(self):
+        """Send each client the visible world, delta-compressed against its last acked snapshot."""
+        tick = self.tick & protocol.NO_TICK
+        if tick == protocol.NO_TICK:
+            tick = self.tick = 0  # Skip the value reserved for "no tick"
+        entities = self.world_state()
+
+        for client in self.clients.values():
+            state = self.visible_state(client, entities)
+            baseline = client.history.get(client.acked_tick, {})
+            base_tick = client.acked_tick if baseline else protocol.NO_TICK
+
+            packet = protocol.encode_snapshot(tick, base_tick, state, baseline)
+            self.transport.sendto(packet, client.addr)
+            client.bytes_sent += len(packet)
+            self.bytes_sent += len(packet)
+
+            client.history[tick] = state
+            while len(client.history) > SNAPSHOT_HISTORY:
+                dropped, _ = client.history.popitem(last=False)
+                if dropped == client.acked_tick:
+                    client.acked_tick = protocol.NO_TICK
+
+    async def run(self, duration=None):
+        """Tick at a fixed rate until cancelled (or for `duration` seconds)."""
+        interval = 1 / self.tick_rate
+        self.started = time.monotonic()
+        next_tick = self.started
+
+        while duration is None or time.monotonic() - self.started < duration:
+            start = time.perf_counter()
+            self.step()
+            self.send_snapshots()
+            self.tick += 1
+            self.tick_times.append((time.perf_counter() - start) * 1000)
+
+            # Schedule against the ideal timeline so ticks don't drift
+            next_tick += interval
+            await asyncio.sleep(max(0, next_tick - time.monotonic()))
+
+
+async def start_server(host, port, tick_rate=SERVER_TICK_RATE):
+    """Bind a GameServer to a UDP port and return (transport, server)."""
+    loop = asyncio.get_running_loop()
+    return await loop.create_datagram_endpoint(
+        lambda: GameServer(tick_rate), local_addr=(host, port))
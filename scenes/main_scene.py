@@ -2,50 +2,78 @@
 
 import pygame
 import sys
-from settings import SCREEN_WIDTH, SCREEN_HEIGHT, BG_COLOR, FPS, TILE_SIZE, WALL_IMAGE_1, WALL_IMAGE_2, TILE_IMAGE_1
+from settings import FPS, TILE_SIZE, WALL_IMAGE_1, WALL_IMAGE_2, TILE_IMAGE_1, RENDER_BACKEND
 from entities.player import Player
 from core.camera import Camera
 from core.dungeon import render_static_dungeon
 from core.inventory import Inventory
 from core.utils import load_image
+from core.memory import memory_tracker
+from core.scheduler import Scheduler
+from core.renderer import create_renderer
+from net import protocol
 from core.input_handler import handle_input
 
 class MainScene:
-    def __init__(self):
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-        pygame.display.set_caption("Simple Dungeon Crawler")
+    def __init__(self, client=None, renderer=RENDER_BACKEND):
+        """
+        :param client: Optional ClientThread; when given, the server owns the game state
+                       and this scene only sends input and draws what the server reports
+        :param renderer: Name of the render backend ('legacy', 'native' or 'texture')
+        """
+        self.renderer = create_renderer(renderer)
         self.clock = pygame.time.Clock()
         
         # Load assets
-        wall_image_1 = load_image(WALL_IMAGE_1, (TILE_SIZE, TILE_SIZE))
-        wall_image_2 = load_image(WALL_IMAGE_2, (TILE_SIZE, TILE_SIZE))
-        ground_image = load_image(TILE_IMAGE_1, (TILE_SIZE, TILE_SIZE))
-        wall_image_1.set_colorkey((0, 0, 0))
-        wall_image_2.set_colorkey((0, 0, 0))
-        ground_image.set_colorkey((0, 0, 0))  # Set black as transparent
+        # Black is transparent on the wall and ground tiles
+        wall_image_1 = load_image(WALL_IMAGE_1, colorkey=(0, 0, 0), user=self)
+        wall_image_2 = load_image(WALL_IMAGE_2, colorkey=(0, 0, 0), user=self)
+        ground_image = load_image(TILE_IMAGE_1, colorkey=(0, 0, 0), user=self)
 
         # Load the dagger image and store it in self.dagger_image
-        self.dagger_image = load_image("assets/weapons/dagger.png", (TILE_SIZE, TILE_SIZE)).convert_alpha()
+        self.dagger_image = load_image("assets/weapons/dagger.png", user=self)
 
         # Initialize game components
-        self.dungeon_surface = render_static_dungeon(wall_image_1, wall_image_2, ground_image)
-        self.player = Player(x=1, y=1, speed=1.5)
-        self.camera = Camera()
+        self.dungeon_surface = memory_tracker.track(
+            render_static_dungeon(wall_image_1, wall_image_2, ground_image), "MainScene", "dungeon")
+        self.scaled_dungeon = None  # Zoomed copy of the dungeon, rebuilt only when the zoom changes
+        self.scaled_dungeon_zoom = None
+        self.player = Player(x=1, y=1, speed=1.2)  # 1.5 px/frame on the old 40 px grid
+        self.camera = Camera(self.renderer.zoom, self.renderer.view_size)
         self.inventory = Inventory()  # Inventory handles both the hotbar and grid
         self.dagger_position = (5 * TILE_SIZE, 5 * TILE_SIZE)
         self.dagger_picked_up = False
         self.inventory_open = False  # State of the inventory
         self.q_pressed = False  # To track if Q is being held down
+        self.show_debug = False  # Memory and update budget overlay, toggled with F3
+        self.f3_pressed = False  # To track if F3 is being held down
+        self.debug_font = None  # Created the first time the debug overlay is shown
+
+        # Co-op state (only used when connected to a server)
+        self.client = client
+        self.remote_players = {}  # player id -> Player drawn for other clients
+        self.server_punching = {}  # player id -> punch flag from the previous snapshot
+        self.dagger_visible = client is None
+
+        # Schedule updates; essential systems run every frame, in this order
+        self.scheduler = Scheduler()
+        if self.client:
+            self.scheduler.add("sync", self.sync_from_server, essential=True)
+        self.scheduler.add("inventory", self.update_inventory, essential=True)
+        self.scheduler.add("camera", self.update_camera, essential=True)
+        self.scheduler.add("player", self.player.update, essential=True)
 
     def run(self):
         """Main game loop."""
         running = True
         while running:
-            self.screen.fill(BG_COLOR)
+            self.renderer.begin_frame()
 
             # Event handling
             for event in pygame.event.get():
-                if event.type == pygame.QUIT:
+                if event.type in (pygame.QUIT, pygame.WINDOWCLOSE):
+                    if self.client:
+                        self.client.close()
                     pygame.quit()
                     sys.exit()
 
@@ -59,48 +87,135 @@ class MainScene:
             self.render()
 
             # Update the display
-            pygame.display.flip()
+            self.renderer.present()
             self.clock.tick(FPS)
 
     def update(self):
         """Update game state and check interactions."""
-        mouse_pos = pygame.mouse.get_pos()
+        self.scheduler.run(self.camera)
 
-        # Update inventory (hotbar is always updated)
-        self.inventory.update(mouse_pos, self.inventory_open)
+    def update_inventory(self):
+        """Update inventory (hotbar is always updated)."""
+        self.inventory.update(pygame.mouse.get_pos(), self.inventory_open)
 
+    def update_camera(self):
+        """Follow the player unless the inventory is open."""
         if not self.inventory_open:
             self.camera.update(self.player)
-        self.player.update()  # Update player animation and state
+
+    def sync_from_server(self):
+        """Copy the server's authoritative state onto the local and remote players."""
+        state = self.client.state
+        self.dagger_visible = (protocol.KIND_ITEM, protocol.DAGGER_ITEM_ID) in state
+
+        seen = set()
+        for (kind, entity_id), (x, y, health, flags) in state.items():
+            if kind != protocol.KIND_PLAYER:
+                continue
+            if entity_id == self.client.player_id:
+                player = self.player
+                if flags & protocol.FLAG_HAS_DAGGER and not self.dagger_picked_up:
+                    if self.inventory.add_item("dagger", self.dagger_image, to_hotbar=True):
+                        self.dagger_picked_up = True
+            else:
+                player = self.remote_players.get(entity_id)
+                if player is None:
+                    player = self.remote_players[entity_id] = Player(x=0, y=0)
+                    # Other players animate less often when they're far from the camera
+                    self.scheduler.add_entity(f"remote_player_{entity_id}", player)
+                seen.add(entity_id)
+
+            player.x = protocol.dequantize(x)
+            player.y = protocol.dequantize(y)
+            player.current_health = health
+            player.is_dead = bool(flags & protocol.FLAG_DEAD)
+            player.is_moving = bool(flags & protocol.FLAG_MOVING)
+            player.last_direction = 'left' if flags & protocol.FLAG_FACING_LEFT else 'right'
+
+            # Start the punch animation when the server reports a new punch
+            punching = bool(flags & protocol.FLAG_PUNCHING)
+            if punching and not self.server_punching.get(entity_id):
+                player.start_punch()
+            self.server_punching[entity_id] = punching
+
+        # Forget players that left or went out of view
+        for entity_id in list(self.remote_players):
+            if entity_id not in seen:
+                del self.remote_players[entity_id]
+                self.server_punching.pop(entity_id, None)
+                self.scheduler.remove(f"remote_player_{entity_id}")
 
     def render(self):
-        """Render the game scene."""
+        """Render the game scene: the world first, then the HUD at window resolution."""
+        world = self.renderer.world
+        ui = self.renderer.ui
+
         # Draw the dungeon and the player
-        self.draw_dungeon()
+        self.draw_dungeon(world)
         
-        # Draw the player (including the health bar)
-        self.player.draw(self.screen, self.camera)
+        # Draw the other co-op players behind our own
+        for remote_player in self.remote_players.values():
+            remote_player.draw_sprite(world, self.camera)
+
+        # Draw the player (its health bar is drawn with the HUD, after the upscale)
+        self.player.update_animation()
+        self.player.draw_sprite(world, self.camera)
 
         # Draw the dagger if it hasn't been picked up
-        if not self.dagger_picked_up:
+        if not self.dagger_picked_up and self.dagger_visible:
             dagger_screen_x = self.dagger_position[0] - self.camera.offset_x
             dagger_screen_y = self.dagger_position[1] - self.camera.offset_y
-            self.screen.blit(self.dagger_image, (dagger_screen_x, dagger_screen_y))
+            world.blit(self.dagger_image, (dagger_screen_x, dagger_screen_y))
+
+        # Scale the finished world up to the window (a no-op for the legacy renderer)
+        self.renderer.upscale()
+
+        # Draw the health bar
+        self.player.draw_health_bar(ui)
 
         # Always draw the hotbar
-        self.inventory.draw_hotbar(self.screen)
+        self.inventory.draw_hotbar(ui)
 
         # Draw the inventory if it's open
         if self.inventory_open:
-            self.inventory.draw(self.screen, inventory_open=True)
+            self.inventory.draw(ui, inventory_open=True)
+
+        # Draw the debug overlay if it's enabled
+        if self.show_debug:
+            self.draw_debug_overlay()
 
-    def draw_dungeon(self):
+    def draw_dungeon(self, surface):
         """Draw the dungeon surface with camera offset."""
-        scaled_dungeon = pygame.transform.scale(
-            self.dungeon_surface,
-            (int(self.dungeon_surface.get_width() * self.camera.zoom),
-             int(self.dungeon_surface.get_height() * self.camera.zoom))
-        )
-        dungeon_rect = scaled_dungeon.get_rect()
+        if self.camera.zoom == 1:
+            # Native resolution: no zoomed copy needed
+            surface.blit(self.dungeon_surface, (-self.camera.offset_x, -self.camera.offset_y))
+            return
+
+        # Only rescale the dungeon when the zoom changes, not every frame
+        if self.scaled_dungeon is None or self.scaled_dungeon_zoom != self.camera.zoom:
+            if self.scaled_dungeon is not None:
+                memory_tracker.untrack(self.scaled_dungeon)
+            self.scaled_dungeon = pygame.transform.scale(
+                self.dungeon_surface,
+                (int(self.dungeon_surface.get_width() * self.camera.zoom),
+                 int(self.dungeon_surface.get_height() * self.camera.zoom))
+            )
+            self.scaled_dungeon_zoom = self.camera.zoom
+            memory_tracker.track(self.scaled_dungeon, "MainScene", "dungeon")
+
+        dungeon_rect = self.scaled_dungeon.get_rect()
         dungeon_rect.topleft = (-self.camera.offset_x, -self.camera.offset_y)
-        self.screen.blit(scaled_dungeon, dungeon_rect)
+        surface.blit(self.scaled_dungeon, dungeon_rect)
+
+    def draw_debug_overlay(self):
+        """Draw tracked surface memory and update budget use in the bottom left corner."""
+        if self.debug_font is None:
+            self.debug_font = pygame.font.SysFont(None, 20)
+
+        ui = self.renderer.ui
+        lines = [f"renderer: {self.renderer.name}"] + memory_tracker.report() + self.scheduler.report()
+        y = ui.get_height() - len(lines) * 18 - 10
+        for line in lines:
+            text = self.debug_font.render(line, True, (255, 255, 255))
+            ui.blit(text, (10, y))
+            y += 18
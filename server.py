@@ -0,0 +1,84 @@
+# server.py
+
+import random
+import asyncio
+import argparse
+from settings import (SERVER_HOST, SERVER_PORT, SERVER_TICK_RATE,
+                      SERVER_TICK_BUDGET_MS, CLIENT_BANDWIDTH_BUDGET)
+from net import protocol
+from net.server import start_server
+from net.client import connect
+
+
+async def simulated_client(host, port, stop):
+    """Join the server and wander around like a player until `stop` is set."""
+    client = await connect(host, port)
+    dx, dy = 0, 0
+    while not stop.is_set():
+        # Pick a new direction about once a second, and punch now and then
+        if random.random() < 1 / SERVER_TICK_RATE:
+            dx, dy = random.choice([-1, 0, 1]), random.choice([-1, 0, 1])
+        buttons = protocol.BUTTON_PUNCH if random.random() < 0.02 else 0
+        client.send_input(dx, dy, buttons)
+        await asyncio.sleep(1 / SERVER_TICK_RATE)
+    client.leave()
+    return client
+
+
+def print_report(server, clients, duration):
+    """Print server tick times and per-client bandwidth against their budgets."""
+    ordered = sorted(server.tick_times)
+    average = sum(ordered) / len(ordered)
+    p95 = ordered[int(len(ordered) * 0.95) - 1]
+    print(f"Server ticks: {len(ordered)} at {server.tick_rate} Hz")
+    print(f"  tick time: avg {average:.3f} ms, p95 {p95:.3f} ms, max {ordered[-1]:.3f} ms "
+          f"(budget {SERVER_TICK_BUDGET_MS} ms) -> {'OK' if p95 <= SERVER_TICK_BUDGET_MS else 'OVER BUDGET'}")
+
+    per_client = sum(client.bytes_received for client in clients) / len(clients) / duration
+    worst = max(client.bytes_received for client in clients) / duration
+    print(f"  bandwidth: {server.bytes_sent / duration / 1024:.1f} KB/s total, "
+          f"{per_client:.0f} B/s per client avg, {worst:.0f} B/s worst "
+          f"(budget {CLIENT_BANDWIDTH_BUDGET} B/s) -> {'OK' if worst <= CLIENT_BANDWIDTH_BUDGET else 'OVER BUDGET'}")
+
+    dropped = sum(client.snapshots_dropped for client in clients)
+    print(f"  snapshots dropped by clients (missing baseline): {dropped}")
+
+
+async def run(host, port, simulate, duration):
+    transport, server = await start_server(host, port)
+    print(f"Server listening on {host}:{port} at {SERVER_TICK_RATE} Hz")
+
+    try:
+        if not simulate:
+            await server.run()
+            return
+
+        # Load test: run the server alongside simulated clients on loopback
+        stop = asyncio.Event()
+        tasks = [asyncio.create_task(simulated_client(host, port, stop)) for _ in range(simulate)]
+        await server.run(duration)
+        stop.set()
+        clients = await asyncio.gather(*tasks)
+        print_report(server, clients, duration)
+    finally:
+        transport.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the authoritative co-op game server.")
+    parser.add_argument("--host", default=SERVER_HOST)
+    parser.add_argument("--port", type=int, default=SERVER_PORT)
+    parser.add_argument("--simulate", type=int, default=0,
+                        help="Number of simulated clients to connect for a load test")
+    parser.add_argument("--duration", type=float, default=10.0,
+                        help="Seconds to run the load test for")
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(run(args.host, args.port, args.simulate, args.duration))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
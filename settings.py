@@ -5,7 +5,7 @@ import os
 # Screen settings
 SCREEN_WIDTH = 1200
 SCREEN_HEIGHT = 700
-TILE_SIZE = 40
+TILE_SIZE = 32  # Source size of the tile art, so tiles are drawn without resampling
 HALF_TILE_SIZE = TILE_SIZE // 2  # Half size for player
 QUART_TILE_SIZE = TILE_SIZE // 3
 TENTH_TILE_SIZE = TILE_SIZE // 10
@@ -18,10 +18,26 @@ BG_COLOR = (0, 0, 0)
 FPS = 60
 
 # Camera settings
-ZOOM = 1.5  # Zoom factor; 2 means 2x zoom
+ZOOM = 1.5  # Zoom factor; 2 means 2x zoom (only used by the legacy renderer)
 CAMERA_CENTER_X = SCREEN_WIDTH // 2
 CAMERA_CENTER_Y = SCREEN_HEIGHT // 2
 
+# Render settings (see core/renderer.py)
+RENDER_BACKEND = "native"   # "legacy" (draw to the window), "native" (one integer upscale) or "texture" (SDL2 renderer)
+RENDER_SCALE = 2            # Whole-number upscale from the internal world surface to the window
+RENDER_ACCELERATED = False  # Let the texture renderer use the GPU; False uses SDL's software renderer
+
+# Update scheduler settings
+UPDATE_BUDGET_MS = 4.0    # Milliseconds per frame that scheduled updates may use
+MAX_DEFERRED_FRAMES = 10  # Frames a task can be pushed back before it runs regardless of the budget
+# (max distance from the camera in world pixels, run every N times less often)
+# Anything further than the last distance uses the last multiplier
+LOD_DISTANCES = [
+    (400, 1),
+    (800, 2),
+    (1600, 4),
+]
+
 # Key mappings for movement
 MOVE_KEYS = {
     'UP': (0, -1),
@@ -58,4 +74,23 @@ TILE_IMAGE_1 = os.path.join(ASSET_PATH, "tile1.png")
 
 # Flashlight effect settings
 FLASHLIGHT_RADIUS = 150       # Radius of the flashlight beam in pixels
-FLASHLIGHT_COLOR = (0, 0, 0, 180)  # Dark color with some transparency (RGBA)
\ No newline at end of file
+FLASHLIGHT_COLOR = (0, 0, 0, 180)  # Dark color with some transparency (RGBA)
+
+# Memory budgets (in bytes) for long-lived surfaces, by category
+MEMORY_BUDGETS = {
+    'images': 2 * 1024 * 1024,   # Tiles, walls and item images from load_image
+    'sprites': 2 * 1024 * 1024,  # Scaled animation frames
+    'dungeon': 8 * 1024 * 1024,  # Pre-rendered dungeon map and its zoomed copy
+    'render': 8 * 1024 * 1024,   # Internal render targets
+}
+MEMORY_BUDGET_WARNINGS = True  # Print a warning when a budget is exceeded and nothing can be evicted
+
+# Network settings (co-op server)
+SERVER_HOST = "127.0.0.1"
+SERVER_PORT = 7777
+SERVER_TICK_RATE = 30            # Simulation ticks per second on the server
+SERVER_TICK_BUDGET_MS = 5.0      # Maximum time one server tick should take
+CLIENT_BANDWIDTH_BUDGET = 8192   # Maximum snapshot bytes per second sent to each client
+CLIENT_TIMEOUT = 5.0             # Seconds without input before a client is dropped
+SNAPSHOT_HISTORY = 64            # Snapshots kept per client to delta against
+INTEREST_MARGIN = TILE_SIZE * 2  # Extra world pixels around the viewport that clients still receive